@@ -191,6 +191,90 @@ def handleExport(args):
             frame.save(str(args.output_dir / f'{y:02d}_{x:02d}_{n:02d}.png'))
 
 
+def handlePreview(args):
+    """
+    Render a contact sheet of all tileset animations
+    """
+    if args.step < 1:
+        print('Error: --step must be at least 1. Aborting.')
+        return
+
+    if args.spacing < 0:
+        print('Error: --spacing must not be negative. Aborting.')
+        return
+
+    # Load tileset
+    with open(args.file, 'rb') as f:
+        tset = u8.load(f.read())
+
+    # Find animation files
+    animFiles = findAnimationFilenames(tset)
+
+    if not animFiles:
+        print('Error: no animations found in this tileset. Aborting.')
+        return
+
+    # Pick out the frames to show for each tile, and concatenate all of
+    # them into one big buffer. Since each frame is 32 pixels wide, a
+    # run of frames is itself a valid 32-pixel-wide RGB4A3 texture, so
+    # everything can be decoded in a single pass instead of per-frame
+    tiles = {}
+    allFrameData = bytearray()
+    numDecoded = 0
+    for fn, animData in sorted(animFiles.items()):
+        tileNum = int(fn[-7:-4], 16)
+        x = tileNum & 0xF
+        y = (tileNum >> 4) & 0xF
+
+        numFrames = len(animData) // 2048
+        shown = range(0, numFrames, args.step)
+        if not shown:
+            continue
+
+        if (y, x) in tiles:
+            print(f'Warning: {fn} is at the same row and column as another'
+                  ' animation, and will not be shown.')
+            continue
+
+        tiles[(y, x)] = range(numDecoded, numDecoded + len(shown))
+        for n in shown:
+            allFrameData += animData[2048 * n : 2048 * (n + 1)]
+        numDecoded += len(shown)
+
+    if not tiles:
+        print('Error: all animations in this tileset are empty. Aborting.')
+        return
+
+    strip = rgb4a3.RGB4A3Decode(allFrameData, 32, 32 * numDecoded)
+
+    # Lay out the sheet: one cell per animated tile, placed by its row
+    # and column in the tileset (skipping rows/columns with no
+    # animations), with the frames running left to right in each cell
+    rows = sorted({y for y, x in tiles})
+    cols = sorted({x for y, x in tiles})
+    cellW = max(len(frames) for frames in tiles.values()) * 24 + args.spacing
+    cellH = 24 + args.spacing
+
+    # (No spacing after the last row or column)
+    sheet = QtGui.QImage(len(cols) * cellW - args.spacing,
+                         len(rows) * cellH - args.spacing,
+                         QtGui.QImage.Format_ARGB32)
+    sheet.fill(Qt.transparent)
+
+    painter = QtGui.QPainter(sheet)
+    for (y, x), frames in tiles.items():
+        cellX = cols.index(x) * cellW
+        cellY = rows.index(y) * cellH
+        for i, n in enumerate(frames):
+            painter.drawImage(cellX + 24 * i, cellY, strip, 4, 32 * n + 4, 24, 24)
+    painter.end()
+
+    # And save it
+    if args.output_file is None:
+        args.output_file = pathlib.Path(str(args.file) + '_preview.png')
+    sheet.save(str(args.output_file))
+
+
 def handleImport(args):
     """
     Import tileset animations
@@ -283,7 +367,7 @@ def main(args=None):
 
     # Main argument parser
     parser = argparse.ArgumentParser(
-        description='Newer Wii Tileset Animations Tool: import or export tileset animations')
+        description='Newer Wii Tileset Animations Tool: import, export or preview tileset animations')
     subparsers = parser.add_subparsers(title='commands',
         description='(run a command with -h for additional help)')
 
@@ -296,6 +380,19 @@ def main(args=None):
         help='directory to store exported animation data in (will be cleared if already exists) (default: input filename plus "_anims")')
     parser_export.set_defaults(func=handleExport)
 
+    # Preview
+    parser_preview = subparsers.add_parser('preview', aliases=['p'],
+                                           help='render all animations into a single contact sheet image')
+    parser_preview.add_argument('file', type=pathlib.Path,
+        help='tileset file to preview animations from')
+    parser_preview.add_argument('output_file', nargs='?', type=pathlib.Path,
+        help='what to save the preview image as (default: input filename plus "_preview.png")')
+    parser_preview.add_argument('--step', type=int, default=1,
+        help='only show every Nth frame of each animation (default: 1, i.e. all frames)')
+    parser_preview.add_argument('--spacing', type=int, default=0,
+        help='number of transparent pixels to leave between animation cells (default: 0)')
+    parser_preview.set_defaults(func=handlePreview)
+
     # Import
     parser_import = subparsers.add_parser('import', aliases=['i'],
                                           help='import animations (replacing all existing ones, unless --add is specified)')